@@ -0,0 +1,81 @@
+"""
+Client-side rate limiting for OpenAI API calls.
+
+Tracks requests-per-minute and tokens-per-minute in a rolling window and
+delays dispatch before the provider would return a 429, so no tokens are
+spent on requests that would be rejected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Tuple
+
+# Conservative defaults; actual limits depend on the OpenAI account tier
+DEFAULT_REQUESTS_PER_MINUTE = 500
+DEFAULT_TOKENS_PER_MINUTE = 200_000
+
+
+class RPMTPMLimiter:
+    """Rolling-window limiter for requests and tokens per minute.
+
+    Callers estimate the token cost of a request up front and call
+    ``acquire`` before dispatching. If admitting the request would exceed
+    either budget within the window, the caller sleeps until enough
+    earlier requests age out.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+        window_seconds: float = 60.0,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Max requests admitted per window
+            tokens_per_minute: Max estimated tokens admitted per window
+            window_seconds: Rolling window length in seconds
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self._events: Deque[Tuple[float, int]] = deque()
+        self._used_tokens = 0
+        self._lock = asyncio.Lock()
+
+    def _prune(self, now: float) -> None:
+        """Drop events that have aged out of the window."""
+        while self._events and now - self._events[0][0] >= self.window_seconds:
+            _, tokens = self._events.popleft()
+            self._used_tokens -= tokens
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request with the given token estimate may dispatch.
+
+        Args:
+            tokens: Estimated prompt + completion tokens for the request
+        """
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._prune(now)
+
+                # A request larger than the whole budget is admitted alone
+                # rather than waiting forever
+                fits = (
+                    len(self._events) < self.requests_per_minute
+                    and self._used_tokens + tokens <= self.tokens_per_minute
+                )
+                if fits or not self._events:
+                    self._events.append((now, tokens))
+                    self._used_tokens += tokens
+                    return
+
+                # Wait for the oldest event to age out, then re-check
+                wait = self.window_seconds - (now - self._events[0][0])
+
+            await asyncio.sleep(max(wait, 0.05))
@@ -7,22 +7,99 @@ Uses OpenAI Agents SDK with structured output.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
+import logging
+import os
+import re
 import sys
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import threading
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+import httpx
+import orjson
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+# Only needed when the module is run outside the installed package layout;
+# plain dirname hops avoid Path.resolve()'s stat/readlink chain at import
+if __package__ in (None, ""):
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+
+from pydantic import BaseModel, TypeAdapter, model_validator
 
 # Import OpenAI client directly for now since agents SDK may not be available
 try:
-    from openai import AsyncOpenAI
+    from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
     OPENAI_AVAILABLE = True
 except ImportError:
+    APIConnectionError = None
+    APITimeoutError = None
     AsyncOpenAI = None
+    RateLimitError = None
     OPENAI_AVAILABLE = False
 
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_delay,
+    wait_exponential_jitter,
+)
+
+from ._ratelimit import (
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_TOKENS_PER_MINUTE,
+    RPMTPMLimiter,
+)
+
+logger = logging.getLogger(__name__)
+
+# tiktoken is used for token-accurate transcript chunking; fall back to a
+# character heuristic if it isn't installed
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+# Transcripts larger than this (in tokens) are summarized with chunked
+# map-reduce instead of a single completion call
+CHUNK_MAX_TOKENS = 12000
+
+# Rough characters-per-token estimate used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+# Completion-token allowance added to prompt estimates for rate limiting
+COMPLETION_TOKEN_ALLOWANCE = 2000
+
+# Errors worth retrying with backoff (empty when openai isn't installed)
+_RETRYABLE_ERRORS = (
+    (RateLimitError, APITimeoutError, APIConnectionError) if OPENAI_AVAILABLE else ()
+)
+
+# Give up on a completion call after this long across all retry attempts
+RETRY_MAX_DELAY_SECONDS = 120
+
+# Default transcript token budget enforced by compaction before prompting
+DEFAULT_TRANSCRIPT_MAX_TOKENS = 48000
+
+# Verbal filler stripped from transcripts before prompting; "you know"
+# is only removed when comma-delimited on both sides so legitimate uses
+# ("Do you know the budget?") survive
+_FILLER_RE = re.compile(r"\b(?:um+|uh+)\b[,.]?\s*", re.IGNORECASE)
+_YOU_KNOW_RE = re.compile(r",\s*you know\s*,", re.IGNORECASE)
+
+# Runs of spaces/tabs collapsed during compaction
+_WHITESPACE_RE = re.compile(r"[ \t]{2,}")
+
+# Connection pool sizing for the shared OpenAI HTTP client
+HTTP_MAX_CONNECTIONS = 200
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 100
+HTTP_TIMEOUT_SECONDS = 120.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 10.0
+
 # Placeholder for agents SDK compatibility
 Agent = None
 AgentOutputSchema = None
@@ -39,6 +116,14 @@ class ActionItem(BaseModel):
     due_date: Optional[str] = None
     priority: Optional[str] = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _coerce_string(cls, value: Any) -> Any:
+        """Accept a bare string as the item description."""
+        if isinstance(value, str):
+            return {"description": value}
+        return value
+
 
 class Decision(BaseModel):
     """A decision made during the meeting."""
@@ -47,6 +132,14 @@ class Decision(BaseModel):
     rationale: Optional[str] = None
     stakeholders: List[str] = []
 
+    @model_validator(mode="before")
+    @classmethod
+    def _coerce_string(cls, value: Any) -> Any:
+        """Accept a bare string as the decision text."""
+        if isinstance(value, str):
+            return {"decision": value}
+        return value
+
 
 class MeetingSummary(BaseModel):
     """Structured summary for downstream automation."""
@@ -62,24 +155,45 @@ class MeetingSummary(BaseModel):
     metadata: Dict[str, Any] = {}
 
 
-class SimpleSummarizerAgent:
-    """Simplified summarizer agent using direct OpenAI API."""
-    
-    def __init__(self, model: str = "gpt-4", api_key: Optional[str] = None):
-        """Initialize the agent.
-        
-        Args:
-            model: OpenAI model to use
-            api_key: OpenAI API key (or from env)
-        """
-        import os
-        self.model = model
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY") or os.getenv("BUDAI_OPENAI_API_KEY")
-        if not OPENAI_AVAILABLE:
-            raise RuntimeError("OpenAI package not available")
-        self.client = AsyncOpenAI(api_key=self.api_key)
-        
-        self.instructions = """You are a professional meeting summarizer specializing in sales calls and business meetings.
+# Validators/serializers built once at import; per-request conversion reuses
+# them instead of re-running Pydantic schema compilation
+ACTION_ITEMS_ADAPTER = TypeAdapter(List[ActionItem])
+DECISIONS_ADAPTER = TypeAdapter(List[Decision])
+
+class PackedSummaries(BaseModel):
+    """Summaries for several meetings packed into one completion call."""
+
+    summaries: List[MeetingSummary] = []
+
+
+# Structured-output response format derived from MeetingSummary, computed
+# once at import. The API then guarantees the JSON shape, so responses
+# validate in a single model_validate_json pass. strict mode stays off
+# because metadata is a free-form object, which strict schemas disallow.
+_SUMMARY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "MeetingSummary",
+        "schema": MeetingSummary.model_json_schema(),
+    },
+}
+
+_PACKED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "PackedSummaries",
+        "schema": PackedSummaries.model_json_schema(),
+    },
+}
+
+# Meetings packed into a single completion call by default
+DEFAULT_PACK_SIZE = 4
+
+
+# System instructions are a module-level constant and are sent verbatim as
+# the first message on every call. A byte-stable prefix lets OpenAI's
+# server-side prompt caching credit the repeated tokens.
+_SYSTEM_PROMPT = """You are a professional meeting summarizer specializing in sales calls and business meetings.
 
 Your role is to:
 1. Extract key points, decisions, and action items from meeting transcripts
@@ -118,9 +232,71 @@ Respond with a valid JSON object following this structure:
 """
 
 
+class SimpleSummarizerAgent:
+    """Simplified summarizer agent using direct OpenAI API."""
+    
+    def __init__(
+        self,
+        model: str = "gpt-4",
+        api_key: Optional[str] = None,
+        transcript_max_tokens: int = DEFAULT_TRANSCRIPT_MAX_TOKENS,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize the agent.
+        
+        Args:
+            model: OpenAI model to use
+            api_key: OpenAI API key (or from env)
+            transcript_max_tokens: Token budget enforced on transcripts
+                before prompting
+            http_client: Externally owned HTTP client to reuse; the agent
+                builds (and owns) its own when omitted
+        """
+        self.model = model
+        self.transcript_max_tokens = transcript_max_tokens
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY") or os.getenv("BUDAI_OPENAI_API_KEY")
+        if not OPENAI_AVAILABLE:
+            raise RuntimeError("OpenAI package not available")
+
+        # One tuned HTTP/2 client shared by all requests: TLS handshakes
+        # are amortized and concurrent calls multiplex over pooled streams
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self._http)
+
+        # Each forked uvicorn worker runs its own limiter; split the
+        # account budget so N workers don't admit N times the allowance
+        worker_share = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+        self.limiter = RPMTPMLimiter(
+            requests_per_minute=max(1, DEFAULT_REQUESTS_PER_MINUTE // worker_share),
+            tokens_per_minute=max(1, DEFAULT_TOKENS_PER_MINUTE // worker_share),
+        )
+        
+        self.instructions = _SYSTEM_PROMPT
+
+        # Cache the encoder and instructions token count once per agent so
+        # the hot path never re-tokenizes the static prompt
+        self._enc = _encoder_for(self.model)
+        self._instructions_tokens = _count_tokens(self.instructions, self.model)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this agent owns it."""
+        if self._owns_http:
+            await self._http.aclose()
+
+
 def create_summarizer_agent(
     model: str = "gpt-4",
     reasoning_effort: str = "medium",
+    transcript_max_tokens: int = DEFAULT_TRANSCRIPT_MAX_TOKENS,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> SimpleSummarizerAgent:
     """Create the meeting summarizer agent.
 
@@ -130,21 +306,380 @@ def create_summarizer_agent(
     Args:
         model: OpenAI model to use
         reasoning_effort: Reasoning effort level (low, medium, high)
+        transcript_max_tokens: Token budget enforced on transcripts
+        http_client: Externally owned HTTP client for the agent to reuse
 
     Returns:
         Configured Agent instance
     """
-    return SimpleSummarizerAgent(model=model)
+    return SimpleSummarizerAgent(
+        model=model,
+        transcript_max_tokens=transcript_max_tokens,
+        http_client=http_client,
+    )
 
 
-async def summarize_meeting(
+@functools.lru_cache(maxsize=8)
+def _encoder_for(model: str) -> Optional[Any]:
+    """Return the (cached) tiktoken encoding for a model.
+
+    Building an encoding is expensive, so one instance per model is shared
+    across all requests.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken is unavailable
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception as exc:
+        # encoding_for_model downloads the BPE file on first use; a
+        # network failure must degrade to the character heuristic, not
+        # take the agent down at startup
+        logger.warning(
+            "Failed to load tiktoken encoding for %s (%s); "
+            "falling back to character heuristic",
+            model,
+            exc,
+        )
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as exc:
+        logger.warning(
+            "Failed to load cl100k_base encoding (%s); "
+            "falling back to character heuristic",
+            exc,
+        )
+        return None
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count tokens in a text for a given model.
+
+    Args:
+        text: Text to count
+        model: OpenAI model name (used to select the encoding)
+
+    Returns:
+        Token count (estimated from characters if tiktoken is unavailable)
+    """
+    encoding = _encoder_for(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def _truncate_to_tokens(
+    text: str,
+    model: str,
+    max_tokens: int,
+    from_end: bool = False,
+) -> str:
+    """Cut text down to a token budget, keeping the start or the end.
+
+    Args:
+        text: Text to truncate
+        model: OpenAI model name (for token counting)
+        max_tokens: Token budget for the result
+        from_end: Keep the last max_tokens tokens instead of the first
+
+    Returns:
+        Truncated text within the token budget
+    """
+    enc = _encoder_for(model)
+    if enc is not None:
+        tokens = enc.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        kept = tokens[-max_tokens:] if from_end else tokens[:max_tokens]
+        return enc.decode(kept)
+
+    max_chars = max_tokens * _CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    return text[-max_chars:] if from_end else text[:max_chars]
+
+
+def _compact_transcript(text: str, model: str, max_tokens: int) -> str:
+    """Compact a transcript deterministically before prompting.
+
+    Meeting transcripts are repetitive: verbal filler, duplicated speaker
+    lines, and re-stated points inflate input tokens without adding
+    information. This strips filler, collapses consecutive duplicate
+    lines, normalizes whitespace, and enforces a token budget by keeping
+    the head and tail of the conversation (openings set context, endings
+    carry decisions and next steps).
+
+    Args:
+        text: Raw transcript text
+        model: OpenAI model name (for token counting)
+        max_tokens: Token budget for the compacted transcript
+
+    Returns:
+        Compacted transcript within the token budget
+    """
+    text = _FILLER_RE.sub("", text)
+    text = _YOU_KNOW_RE.sub(",", text)
+    text = _WHITESPACE_RE.sub(" ", text)
+
+    # Collapse consecutive duplicate lines (repeated speaker turns)
+    lines = [line.strip() for line in text.splitlines()]
+    lines = [line for line, _ in itertools.groupby(lines)]
+    compacted = "\n".join(lines)
+
+    if _count_tokens(compacted, model) <= max_tokens:
+        return compacted
+
+    # Still over budget: keep ~30% of the budget from the head and ~50%
+    # from the tail, accumulating per-line token counts so the budget
+    # holds no matter how long individual turns are
+    head_budget = max(1, int(max_tokens * 0.3))
+    tail_budget = max(1, int(max_tokens * 0.5))
+
+    head_lines: List[str] = []
+    used = 0
+    for line in lines:
+        line_tokens = _count_tokens(line, model)
+        if used + line_tokens > head_budget:
+            break
+        head_lines.append(line)
+        used += line_tokens
+
+    tail_lines: List[str] = []
+    used = 0
+    for line in reversed(lines[len(head_lines):]):
+        line_tokens = _count_tokens(line, model)
+        if used + line_tokens > tail_budget:
+            break
+        tail_lines.append(line)
+        used += line_tokens
+    tail_lines.reverse()
+
+    # Degenerate case (e.g. one enormous line, a common provider format):
+    # no whole line fits either budget, so truncate within the text
+    # itself rather than dropping all content
+    if not head_lines and not tail_lines:
+        return (
+            _truncate_to_tokens(compacted, model, head_budget)
+            + "\n...[trimmed]...\n"
+            + _truncate_to_tokens(compacted, model, tail_budget, from_end=True)
+        )
+
+    trimmed = len(lines) - len(head_lines) - len(tail_lines)
+    return (
+        "\n".join(head_lines)
+        + f"\n...[trimmed {trimmed} turns]...\n"
+        + "\n".join(tail_lines)
+    )
+
+
+def _chunk_transcript(
+    transcript: str,
+    model: str,
+    max_tokens: int = CHUNK_MAX_TOKENS,
+) -> Tuple[List[str], int]:
+    """Split a transcript into token-bounded chunks at paragraph breaks.
+
+    Paragraphs are accumulated greedily until the token budget is reached.
+    A single paragraph larger than the budget is split on its own. The
+    total token count is returned alongside the chunks so callers (rate
+    limiter, logging) don't have to re-tokenize the transcript.
+
+    Args:
+        transcript: Full transcript text
+        model: OpenAI model name (for token counting)
+        max_tokens: Maximum tokens per chunk
+
+    Returns:
+        (chunks, total_tokens) tuple; each chunk is within the token budget
+    """
+    total_tokens = _count_tokens(transcript, model)
+    if total_tokens <= max_tokens:
+        return [transcript], total_tokens
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for paragraph in transcript.split("\n\n"):
+        paragraph_tokens = _count_tokens(paragraph, model)
+
+        if paragraph_tokens > max_tokens:
+            # Oversized paragraph: flush what we have, then hard-split it
+            if current:
+                chunks.append("\n\n".join(current))
+                current = []
+                current_tokens = 0
+            max_chars = max_tokens * _CHARS_PER_TOKEN
+            for start in range(0, len(paragraph), max_chars):
+                chunks.append(paragraph[start:start + max_chars])
+            continue
+
+        if current and current_tokens + paragraph_tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current = []
+            current_tokens = 0
+
+        current.append(paragraph)
+        current_tokens += paragraph_tokens
+
+    if current:
+        chunks.append("\n\n".join(current))
+
+    return chunks, total_tokens
+
+
+_BACKOFF_WAIT = wait_exponential_jitter(initial=1, max=30)
+
+
+def _retry_wait(retry_state: Any) -> float:
+    """Wait exactly as long as the server asks, else back off with jitter.
+
+    Rate-limit responses usually carry a Retry-After header; honoring it
+    avoids both premature retries (guaranteed 429) and overshooting.
+
+    Args:
+        retry_state: Tenacity retry state for the failed attempt
+
+    Returns:
+        Seconds to sleep before the next attempt
+    """
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    response = getattr(exc, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return _BACKOFF_WAIT(retry_state)
+
+
+@retry(
+    wait=_retry_wait,
+    stop=stop_after_delay(RETRY_MAX_DELAY_SECONDS),
+    retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+)
+async def _create_completion(
+    agent: SimpleSummarizerAgent,
+    messages: List[Dict[str, str]],
+    est_tokens: Optional[int] = None,
+    **kwargs: Any,
+) -> Any:
+    """Call chat.completions with preemptive rate limiting and retry.
+
+    Estimates prompt + completion tokens, waits on the agent's limiter
+    until the rolling RPM/TPM window has room, then dispatches. Rate-limit,
+    timeout, and connection errors are retried for up to
+    RETRY_MAX_DELAY_SECONDS, honoring any Retry-After the server sends.
+
+    Args:
+        agent: Configured summarizer agent
+        messages: Chat messages to send
+        est_tokens: Precomputed prompt-token estimate; when given, the
+            messages are not re-tokenized
+        **kwargs: Extra arguments for chat.completions.create
+
+    Returns:
+        Chat completion response
+    """
+    if est_tokens is None:
+        est_tokens = sum(
+            _count_tokens(message["content"], agent.model) for message in messages
+        )
+    await agent.limiter.acquire(est_tokens + COMPLETION_TOKEN_ALLOWANCE)
+    return await agent.client.chat.completions.create(
+        model=agent.model,
+        messages=messages,
+        **kwargs,
+    )
+
+
+def _build_user_prompt(
+    meeting_id: str,
+    title: str,
+    transcript: str,
+    context_str: str = "",
+) -> str:
+    """Build the user prompt for a single-call summarization.
+
+    Args:
+        meeting_id: Meeting identifier
+        title: Meeting title
+        transcript: Transcript text
+        context_str: Pre-formatted additional-context block
+
+    Returns:
+        Prompt string for the user message
+    """
+    return f"""Meeting: {title}
+Meeting ID: {meeting_id}
+{context_str}
+
+Transcript:
+{transcript}
+
+Please provide a comprehensive summary of this meeting."""
+
+
+async def _summarize_chunk(
+    agent: SimpleSummarizerAgent,
+    title: str,
+    chunk: str,
+    index: int,
+    total: int,
+) -> str:
+    """Summarize a single transcript chunk (map phase).
+
+    Args:
+        agent: Configured summarizer agent
+        title: Meeting title
+        chunk: Transcript section text
+        index: 1-based section number
+        total: Total number of sections
+
+    Returns:
+        Plain-text summary of the section
+    """
+    chunk_prompt = f"""This is section {index} of {total} of the transcript for meeting: {title}
+
+Summarize this section concisely. Preserve all action items, decisions, risks,
+and attendee names verbatim so nothing is lost when sections are combined.
+
+Section transcript:
+{chunk}"""
+
+    response = await _create_completion(
+        agent,
+        [
+            {"role": "system", "content": agent.instructions},
+            {"role": "user", "content": chunk_prompt},
+        ],
+        temperature=0.3,
+    )
+    return response.choices[0].message.content or ""
+
+
+async def _prepare_final_prompt(
     agent: SimpleSummarizerAgent,
     meeting_id: str,
     title: str,
     transcript: str,
     additional_context: Optional[Dict[str, Any]] = None,
-) -> MeetingSummary:
-    """Summarize a meeting using the agent.
+) -> Tuple[str, Optional[int]]:
+    """Prepare the user prompt for the final summarization call.
+
+    Short transcripts produce a single-call prompt. Long transcripts run
+    the map phase here (concurrent chunk summaries) and return the reduce
+    prompt built from the section summaries.
 
     Args:
         agent: Configured summarizer agent
@@ -154,69 +689,115 @@ async def summarize_meeting(
         additional_context: Optional additional context
 
     Returns:
-        Structured meeting summary
+        (user_prompt, est_tokens) tuple. est_tokens is the precomputed
+        prompt-token estimate for the single-call path, or None when the
+        reduce prompt should be counted directly.
     """
-    import json
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
-    # Prepare input prompt
-    context_str = ""
-    if additional_context:
-        context_str = "\n\nAdditional Context:\n"
-        for key, value in additional_context.items():
-            context_str += f"- {key}: {value}\n"
-
-    user_prompt = f"""Meeting: {title}
+    # Single join instead of repeated string concatenation, which is
+    # quadratic for large context dicts
+    context_str = (
+        "\n\nAdditional Context:\n"
+        + "\n".join(f"- {key}: {value}" for key, value in additional_context.items())
+        + "\n"
+        if additional_context
+        else ""
+    )
+
+    # Strip filler and duplicates before spending tokens on the prompt
+    transcript = _compact_transcript(transcript, agent.model, agent.transcript_max_tokens)
+
+    chunks, transcript_tokens = _chunk_transcript(transcript, agent.model)
+
+    if len(chunks) > 1:
+        # Map-reduce: summarize each chunk concurrently, then combine the
+        # partial summaries into the final structured summary
+        logger.info(
+            "Transcript for meeting %s split into %d chunks", meeting_id, len(chunks)
+        )
+        partial_summaries = await asyncio.gather(
+            *[
+                _summarize_chunk(agent, title, chunk, index, len(chunks))
+                for index, chunk in enumerate(chunks, start=1)
+            ]
+        )
+        sections = "\n\n".join(
+            f"--- Section {index} summary ---\n{partial}"
+            for index, partial in enumerate(partial_summaries, start=1)
+        )
+        user_prompt = f"""Meeting: {title}
 Meeting ID: {meeting_id}
 {context_str}
 
-Transcript:
-{transcript}
+The transcript was summarized in sections. Combine the section summaries below
+into one comprehensive summary of the full meeting.
+
+{sections}
 
 Please provide a comprehensive summary of this meeting."""
+        # The reduce prompt is much smaller than the transcript, so it is
+        # counted directly by _create_completion
+        return user_prompt, None
+
+    user_prompt = _build_user_prompt(meeting_id, title, transcript, context_str)
+
+    # Reuse the token count from chunking for the limiter estimate instead
+    # of tokenizing the prompt a second time
+    est_tokens = agent._instructions_tokens + transcript_tokens
+    if context_str:
+        est_tokens += _count_tokens(context_str, agent.model)
 
+    return user_prompt, est_tokens
+
+
+async def summarize_meeting(
+    agent: SimpleSummarizerAgent,
+    meeting_id: str,
+    title: str,
+    transcript: str,
+    additional_context: Optional[Dict[str, Any]] = None,
+) -> MeetingSummary:
+    """Summarize a meeting using the agent.
+
+    Args:
+        agent: Configured summarizer agent
+        meeting_id: Meeting identifier
+        title: Meeting title
+        transcript: Meeting transcript text
+        additional_context: Optional additional context
+
+    Returns:
+        Structured meeting summary
+    """
     try:
+        user_prompt, est_tokens = await _prepare_final_prompt(
+            agent, meeting_id, title, transcript, additional_context
+        )
+
         # Call OpenAI API with structured output request
-        response = await agent.client.chat.completions.create(
-            model=agent.model,
-            messages=[
+        response = await _create_completion(
+            agent,
+            [
                 {"role": "system", "content": agent.instructions},
                 {"role": "user", "content": user_prompt}
             ],
-            response_format={"type": "json_object"},
+            est_tokens=est_tokens,
+            response_format=_SUMMARY_RESPONSE_FORMAT,
             temperature=0.3,
         )
-        
-        # Parse the response
+
+        # Log prompt-cache hits so the prefix-caching benefit is verifiable
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens:
+            logger.debug(
+                "Prompt cache hit for meeting %s: %d cached tokens", meeting_id, cached_tokens
+            )
+
+        # Parse and validate the response in one pass
         content = response.choices[0].message.content
-        result_data = json.loads(content)
-        
-        # Convert action items and decisions to proper models
-        action_items = [
-            ActionItem(**item) if isinstance(item, dict) else ActionItem(description=str(item))
-            for item in result_data.get("action_items", [])
-        ]
-        
-        decisions = [
-            Decision(**dec) if isinstance(dec, dict) else Decision(decision=str(dec))
-            for dec in result_data.get("decisions", [])
-        ]
-        
-        # Create summary object
-        summary = MeetingSummary(
-            title=result_data.get("title", title),
-            summary=result_data.get("summary", ""),
-            key_points=result_data.get("key_points", []),
-            action_items=action_items,
-            decisions=decisions,
-            risks=result_data.get("risks", []),
-            next_steps=result_data.get("next_steps", []),
-            attendees_mentioned=result_data.get("attendees_mentioned", []),
-            metadata=result_data.get("metadata", {}),
-        )
-        
+        summary = MeetingSummary.model_validate_json(content)
+
     except Exception as exc:
         logger.error(f"Failed to generate summary: {exc}")
         # Fallback summary
@@ -234,6 +815,274 @@ Please provide a comprehensive summary of this meeting."""
     return summary
 
 
+async def summarize_meeting_stream(
+    agent: SimpleSummarizerAgent,
+    meeting_id: str,
+    title: str,
+    transcript: str,
+    additional_context: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[str]:
+    """Stream the summary JSON as the model generates it.
+
+    Behaves like summarize_meeting but yields content deltas as soon as
+    they arrive instead of waiting for the full completion, so consumers
+    can start processing partial output (key points, early action items)
+    while the model is still writing. Long transcripts still run the map
+    phase first; only the final reduce call is streamed.
+
+    Args:
+        agent: Configured summarizer agent
+        meeting_id: Meeting identifier
+        title: Meeting title
+        transcript: Meeting transcript text
+        additional_context: Optional additional context
+
+    Yields:
+        Raw JSON content fragments in generation order
+    """
+    user_prompt, est_tokens = await _prepare_final_prompt(
+        agent, meeting_id, title, transcript, additional_context
+    )
+
+    stream = await _create_completion(
+        agent,
+        [
+            {"role": "system", "content": agent.instructions},
+            {"role": "user", "content": user_prompt},
+        ],
+        est_tokens=est_tokens,
+        response_format=_SUMMARY_RESPONSE_FORMAT,
+        temperature=0.3,
+        stream=True,
+    )
+
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+async def _summarize_pack(
+    agent: SimpleSummarizerAgent,
+    pack: List[tuple[str, str, str]],
+) -> List[MeetingSummary]:
+    """Summarize one pack of meetings in a single completion call.
+
+    Falls back to per-meeting calls if the packed response fails
+    validation or doesn't cover every meeting.
+
+    Args:
+        agent: Configured summarizer agent
+        pack: (meeting_id, title, transcript) tuples for this pack
+
+    Returns:
+        One summary per meeting, in pack order
+    """
+    sections = "\n\n".join(
+        f"---MEETING {index}---\nMeeting ID: {meeting_id}\nTitle: {title}\nTranscript:\n{transcript}"
+        for index, (meeting_id, title, transcript) in enumerate(pack, start=1)
+    )
+    packed_prompt = f"""Summarize each of the following {len(pack)} meetings independently.
+Return a JSON object {{"summaries": [...]}} with exactly one summary per
+meeting, in the same order as the meetings below.
+
+{sections}"""
+
+    try:
+        response = await _create_completion(
+            agent,
+            [
+                {"role": "system", "content": agent.instructions},
+                {"role": "user", "content": packed_prompt},
+            ],
+            response_format=_PACKED_RESPONSE_FORMAT,
+            temperature=0.3,
+        )
+        packed = PackedSummaries.model_validate_json(response.choices[0].message.content)
+        if len(packed.summaries) != len(pack):
+            raise ValueError(
+                f"Packed response covered {len(packed.summaries)} of {len(pack)} meetings"
+            )
+        summaries = packed.summaries
+    except Exception as exc:
+        # Per-meeting fallback keeps one bad pack from losing all K results
+        logger.warning("Packed summarization failed (%s); falling back per meeting", exc)
+        summaries = list(
+            await asyncio.gather(
+                *[
+                    summarize_meeting(agent, meeting_id, title, transcript)
+                    for meeting_id, title, transcript in pack
+                ]
+            )
+        )
+
+    for (meeting_id, _title, _transcript), summary in zip(pack, summaries):
+        summary.metadata["meeting_id"] = meeting_id
+        summary.metadata["agent_name"] = "Meeting Summarizer"
+        summary.metadata["model"] = agent.model
+
+    return summaries
+
+
+async def summarize_meetings_packed(
+    agent: SimpleSummarizerAgent,
+    items: List[tuple[str, str, str]],
+    pack_size: int = DEFAULT_PACK_SIZE,
+) -> List[MeetingSummary]:
+    """Summarize several short meetings with packed completion calls.
+
+    Places pack_size meetings inside one request, amortizing the HTTPS
+    round trip and system prompt over K meetings. Useful when the binding
+    rate limit is requests-per-minute rather than tokens-per-minute, as
+    with many short sales calls.
+
+    Args:
+        agent: Configured summarizer agent
+        items: (meeting_id, title, transcript) tuples
+        pack_size: Meetings per completion call
+
+    Returns:
+        One summary per meeting, in input order
+    """
+    packs = [items[start:start + pack_size] for start in range(0, len(items), pack_size)]
+    results = await asyncio.gather(*[_summarize_pack(agent, pack) for pack in packs])
+    return [summary for pack_result in results for summary in pack_result]
+
+
+async def submit_batch_summaries(
+    agent: SimpleSummarizerAgent,
+    meetings: List[tuple[str, str, str]],
+) -> str:
+    """Submit meetings for asynchronous summarization via the OpenAI Batch API.
+
+    Builds one JSONL file with a chat.completions request per meeting and
+    creates a batch job. Batch requests run in a separate rate-limit pool at
+    roughly half the per-token cost, which suits back-fill and overnight
+    workloads that don't need interactive latency.
+
+    Args:
+        agent: Configured summarizer agent
+        meetings: List of (meeting_id, title, transcript) tuples
+
+    Returns:
+        OpenAI batch job ID
+    """
+    lines = []
+    for meeting_id, title, transcript in meetings:
+        body = {
+            "model": agent.model,
+            "messages": [
+                {"role": "system", "content": agent.instructions},
+                {"role": "user", "content": _build_user_prompt(meeting_id, title, transcript)},
+            ],
+            "response_format": _SUMMARY_RESPONSE_FORMAT,
+            "temperature": 0.3,
+        }
+        lines.append(
+            orjson.dumps(
+                {
+                    "custom_id": meeting_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }
+            )
+        )
+
+    payload = b"\n".join(lines)
+    batch_file = await agent.client.files.create(
+        file=("summaries.jsonl", payload),
+        purpose="batch",
+    )
+    batch = await agent.client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+async def poll_batch(agent: SimpleSummarizerAgent, batch_id: str) -> Any:
+    """Retrieve the current state of a batch job.
+
+    Args:
+        agent: Configured summarizer agent
+        batch_id: OpenAI batch job ID
+
+    Returns:
+        Batch object with status, request counts, and output file reference
+    """
+    return await agent.client.batches.retrieve(batch_id)
+
+
+async def collect_batch_summaries(
+    agent: SimpleSummarizerAgent,
+    batch_id: str,
+) -> Dict[str, MeetingSummary]:
+    """Collect results from a completed batch job.
+
+    Args:
+        agent: Configured summarizer agent
+        batch_id: OpenAI batch job ID
+
+    Returns:
+        Mapping of meeting_id to structured summary
+
+    Raises:
+        RuntimeError: If the batch has not completed yet
+    """
+    batch = await agent.client.batches.retrieve(batch_id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch_id} not completed (status: {batch.status})")
+
+    output = await agent.client.files.content(batch.output_file_id)
+
+    summaries: Dict[str, MeetingSummary] = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        meeting_id = record.get("custom_id", "")
+        try:
+            content = record["response"]["body"]["choices"][0]["message"]["content"]
+            summary = MeetingSummary.model_validate_json(content)
+        except Exception as exc:
+            logger.error("Failed to parse batch result for %s: %s", meeting_id, exc)
+            summary = MeetingSummary(
+                title=meeting_id,
+                summary=f"Summary generation encountered an error: {exc}",
+                metadata={"meeting_id": meeting_id, "error": str(exc)},
+            )
+
+        summary.metadata["meeting_id"] = meeting_id
+        summary.metadata["agent_name"] = "Meeting Summarizer"
+        summary.metadata["model"] = agent.model
+        summaries[meeting_id] = summary
+
+    return summaries
+
+
+# Dedicated event loop for the synchronous wrapper, started lazily in a
+# daemon thread. Reusing one loop avoids per-call loop setup/teardown and
+# keeps the shared HTTP connection pool alive across sync calls.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="summarizer-sync-loop",
+                daemon=True,
+            ).start()
+            _sync_loop = loop
+    return _sync_loop
+
+
 # Synchronous wrapper for compatibility
 def summarize_meeting_sync(
     agent: SimpleSummarizerAgent,
@@ -254,9 +1103,9 @@ def summarize_meeting_sync(
     Returns:
         Structured meeting summary
     """
-    import asyncio
-
-    return asyncio.run(
-        summarize_meeting(agent, meeting_id, title, transcript, additional_context)
+    future = asyncio.run_coroutine_threadsafe(
+        summarize_meeting(agent, meeting_id, title, transcript, additional_context),
+        _get_sync_loop(),
     )
+    return future.result()
 
@@ -4,10 +4,15 @@ Agent Summarizer installer implementing PRIME_DIRECTIVE contract.
 
 from __future__ import annotations
 
+import os
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+# Only needed when the module is run outside the installed package layout;
+# plain dirname hops avoid Path.resolve()'s stat/readlink chain at import
+if __package__ in (None, ""):
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
 from installer import (
     ApplyResult,
@@ -6,42 +6,161 @@ Exposes the summarizer agent as an HTTP API for orchestrator invocation.
 
 from __future__ import annotations
 
-import logging
+import asyncio
+import hashlib
 import os
+import queue
 import sys
-from pathlib import Path
+import time
+
+# picologging is a C-accelerated drop-in for stdlib logging; fall back
+# silently when it isn't installed
+try:
+    import picologging as logging
+    from picologging.handlers import QueueHandler, QueueListener
+except ImportError:
+    import logging
+    from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, List, Optional
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+# Only needed when the module is run outside the installed package layout;
+# plain dirname hops avoid Path.resolve()'s stat/readlink chain at import
+if __package__ in (None, ""):
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+import httpx
+import orjson
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from shared import (
     AgentServiceSettings,
     HealthChecker,
     ServiceObservability,
+    SummaryGeneratedEvent,
+    TTLCachedCheck,
     check_openai_api,
     check_redis_connection,
     create_event_bus,
     init_observability,
 )
 
-from .agent import ActionItem, Decision, MeetingSummary, create_summarizer_agent, summarize_meeting
+from .agent import (
+    ACTION_ITEMS_ADAPTER,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_TIMEOUT_SECONDS,
+    DECISIONS_ADAPTER,
+    MeetingSummary,
+    collect_batch_summaries,
+    create_summarizer_agent,
+    poll_batch,
+    submit_batch_summaries,
+    summarize_meeting,
+    summarize_meeting_stream,
+    summarize_meetings_packed,
+)
+
+# Listener threads doing log I/O; stopped (and thereby flushed) on shutdown
+_LOG_LISTENERS: list = []
+
+
+def _configure_logging() -> None:
+    """Route log records through queues so I/O leaves the event loop.
+
+    Handlers write synchronously; under load that write() happens on the
+    request path. A QueueHandler makes emission a lock-free enqueue and a
+    listener thread does the actual I/O. picologging keeps its own logger
+    tree, so when it is active the stdlib root (used by the shared
+    modules) is routed through a queue as well.
+    """
+    import logging as std_logging
+    from logging.handlers import QueueHandler as StdQueueHandler
+    from logging.handlers import QueueListener as StdQueueListener
+
+    roots = [(logging, QueueHandler, QueueListener)]
+    if logging is not std_logging:
+        roots.append((std_logging, StdQueueHandler, StdQueueListener))
+
+    for module, queue_handler_cls, listener_cls in roots:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root = module.getLogger()
+        root.setLevel(module.INFO)
+        # Existing handlers (e.g. the structured one installed by shared
+        # observability) move behind the listener thread
+        handlers = root.handlers[:] or [module.StreamHandler()]
+        root.handlers = [queue_handler_cls(log_queue)]
+        listener = listener_cls(log_queue, *handlers)
+        listener.start()
+        _LOG_LISTENERS.append(listener)
+
+
+def _stop_logging() -> None:
+    """Stop the listener threads, flushing any queued records."""
+    while _LOG_LISTENERS:
+        _LOG_LISTENERS.pop().stop()
+
 
 # Initialize logging
-logging.basicConfig(level=logging.INFO)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
+# Metric buffering: flush when this many events accumulate or after this
+# long, whichever comes first
+METRIC_FLUSH_MAX_EVENTS = 100
+METRIC_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Cached summaries expire after this long
+SUMMARY_CACHE_TTL_SECONDS = 86400
+
+# Serialized /health responses are reused for this long (Cache-Control)
+HEALTH_CACHE_TTL_SECONDS = 10.0
+
+# The background refresher re-runs the health probes this often; kept at
+# the advertised TTL so the snapshot never outlives the Cache-Control
+HEALTH_REFRESH_INTERVAL_SECONDS = HEALTH_CACHE_TTL_SECONDS
+
+# Metric tags shared by every summarizer emission; allocated once
+_SUMMARIZER_TAGS = {"agent": "summarizer"}
+
+# The root endpoint body never changes; serialize it once at import
+_ROOT_BODY = orjson.dumps(
+    {
+        "service": "BudAI Agent Summarizer",
+        "version": "1.0.0",
+        "agent": "Meeting Summarizer",
+        "status": "running",
+    }
+)
+
+# Micro-batching window for coalescing concurrent /summarize calls
+SUMMARIZE_BATCH_MAX = 8
+SUMMARIZE_BATCH_WINDOW_SECONDS = 0.02
+
+# Failed summarizations land on this Redis list for background retry
+RETRY_QUEUE_KEY = "budai:summarize:retry"
+RETRY_MAX_ATTEMPTS = 3
+RETRY_POLL_INTERVAL_SECONDS = 30.0
+
 
 class SummarizeRequest(BaseModel):
-    """Request to summarize a meeting."""
+    """Request to summarize a meeting.
+
+    The transcript can be sent inline or referenced by URL; a URL keeps
+    multi-megabyte transcripts out of the JSON request body entirely.
+    """
 
     task_id: str
     meeting_id: str
     title: str
-    transcript: str
+    transcript: str = ""
+    transcript_url: Optional[str] = None
     additional_context: Optional[Dict[str, Any]] = None
 
 
@@ -60,6 +179,209 @@ class SummarizeResponse(BaseModel):
     metadata: Dict[str, Any]
 
 
+# Validates request bytes straight to a model in pydantic-core, skipping
+# FastAPI's dependency-injection parse and its intermediate dict tree
+_REQUEST_ADAPTER = TypeAdapter(SummarizeRequest)
+
+
+def _parse_summarize_request(raw: bytes) -> SummarizeRequest:
+    """Validate raw request bytes into a SummarizeRequest.
+
+    Args:
+        raw: JSON request body
+
+    Returns:
+        Validated request model
+
+    Raises:
+        HTTPException: 422 when the body fails validation
+    """
+    try:
+        return _REQUEST_ADAPTER.validate_json(raw)
+    except ValidationError as exc:
+        # Rebuild the error list from serializable fields only: errors()
+        # includes the offending input, which for a malformed body is the
+        # raw bytes and would blow up the exception handler's json.dumps
+        detail = [
+            {
+                "loc": list(err.get("loc", ())),
+                "msg": err.get("msg", ""),
+                "type": err.get("type", ""),
+            }
+            for err in exc.errors(include_url=False)
+        ]
+        raise HTTPException(status_code=422, detail=detail)
+
+
+class BatchAsyncItem(BaseModel):
+    """A single meeting for asynchronous batch summarization."""
+
+    meeting_id: str
+    title: str
+    transcript: str
+
+
+class BatchAsyncSummarizeRequest(BaseModel):
+    """Request to summarize meetings via the OpenAI Batch API."""
+
+    items: List[BatchAsyncItem]
+
+
+class BatchAsyncSummarizeResponse(BaseModel):
+    """Response containing the submitted batch job ID."""
+
+    batch_id: str
+    item_count: int
+
+
+class BatchSummarizeRequest(BaseModel):
+    """Request to summarize multiple meetings in one call."""
+
+    items: List[SummarizeRequest]
+
+
+class BatchItemResult(BaseModel):
+    """Result of a single item in a batch summarization."""
+
+    task_id: str
+    meeting_id: str
+    success: bool
+    response: Optional[SummarizeResponse] = None
+    error: Optional[str] = None
+
+
+class BatchSummarizeResponse(BaseModel):
+    """Response from batch summarization, preserving input order."""
+
+    results: List[BatchItemResult]
+
+
+class SummarizeBatcher:
+    """Coalesces near-simultaneous summarize calls into grouped dispatches.
+
+    Requests arriving within a short window are drained together and
+    dispatched concurrently, so bursts share the agent's HTTP/2
+    connection pool and land close enough together to hit the provider's
+    prompt cache. Each caller awaits its own future, preserving
+    per-request responses and errors.
+    """
+
+    def __init__(
+        self,
+        dispatch: Any,
+        max_batch: int = SUMMARIZE_BATCH_MAX,
+        window_seconds: float = SUMMARIZE_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            dispatch: Async callable invoked once per request in a batch
+            max_batch: Max requests dispatched together
+            window_seconds: How long to wait for more requests to arrive
+        """
+        self._dispatch = dispatch
+        self.max_batch = max_batch
+        self.window_seconds = window_seconds
+        self._queue: asyncio.Queue[tuple[SummarizeRequest, asyncio.Future]] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the background batching worker."""
+        self._worker = asyncio.create_task(self._run())
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the batching worker is active."""
+        return self._worker is not None
+
+    async def stop(self) -> None:
+        """Stop the worker and fail anything queued or still in flight."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._inflight:
+            for task in self._inflight:
+                task.cancel()
+            # _dispatch_batch fails its futures on the way out, so their
+            # callers are released rather than left hanging
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(
+                    HTTPException(status_code=503, detail="Service shutting down")
+                )
+
+    async def submit(self, request: SummarizeRequest) -> SummarizeResponse:
+        """Enqueue a request and wait for its result.
+
+        Args:
+            request: Summarization request
+
+        Returns:
+            The response produced by the dispatch callable
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue in Nagle-style batches and dispatch them.
+
+        Each drained batch is dispatched as a detached task so the worker
+        goes straight back to draining; requests arriving while a slow
+        batch is in flight are never blocked behind it.
+        """
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                # asyncio.timeout rather than wait_for per get: wait_for
+                # can swallow an external cancel arriving in the same
+                # tick as a request, wedging stop() on await self._worker
+                async with asyncio.timeout(self.window_seconds):
+                    while len(batch) < self.max_batch:
+                        batch.append(await self._queue.get())
+            except TimeoutError:
+                pass
+
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch_batch(
+        self, batch: List[tuple[SummarizeRequest, asyncio.Future]]
+    ) -> None:
+        """Dispatch one batch concurrently and resolve its futures.
+
+        Args:
+            batch: Drained (request, future) pairs
+        """
+        try:
+            outcomes = await asyncio.gather(
+                *(self._dispatch(request) for request, _ in batch),
+                return_exceptions=True,
+            )
+            for (_, future), outcome in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+        finally:
+            # Covers cancellation mid-gather: never leave a caller hanging
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        HTTPException(status_code=503, detail="Service shutting down")
+                    )
+
+
 class AgentSummarizerService:
     """Meeting Summarizer agent service application."""
 
@@ -80,17 +402,53 @@ class AgentSummarizerService:
             logger.warning("Failed to initialize event bus: %s. Service will continue without event publishing.", exc)
             self.event_bus = None
         
+        # One service-owned HTTP/2 client shared with the agent so all
+        # OpenAI traffic multiplexes over a single pre-warmed pool
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+
         # Create agent - gracefully handle initialization errors
         try:
             self.agent = create_summarizer_agent(
                 model=self.settings.openai_default_model,
                 reasoning_effort=self.settings.reasoning_effort,
+                transcript_max_tokens=self.settings.transcript_max_tokens,
+                http_client=self._http,
             )
             logger.info("Agent initialized successfully with model: %s", self.settings.openai_default_model)
         except Exception as exc:
             logger.error("Failed to initialize agent: %s", exc)
             self.agent = None
         
+        # Bound concurrent agent invocations from batch requests
+        self._summarize_semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests)
+
+        # Metrics are buffered here and flushed in batches off the request path
+        self._metric_queue: asyncio.Queue[tuple[str, float, Optional[Dict[str, str]]]] = asyncio.Queue()
+        self._metric_task: Optional[asyncio.Task] = None
+
+        # Background worker draining the failed-summarization retry queue
+        self._retry_task: Optional[asyncio.Task] = None
+
+        # Coalesces concurrent /summarize calls into grouped dispatches
+        self._batcher = SummarizeBatcher(self.summarize)
+
+        # Event-publish tasks detached from the request path; tracked so
+        # shutdown can drain them and they aren't garbage collected early
+        self._pending_publishes: set[asyncio.Task] = set()
+
+        # Serialized /health report: (checked_at, body_bytes, status_code),
+        # kept fresh by the background refresher
+        self._health_cache: Optional[tuple[float, bytes, int]] = None
+        self._health_lock = asyncio.Lock()
+        self._health_task: Optional[asyncio.Task] = None
+
         # Register health checks
         self._register_health_checks()
 
@@ -107,7 +465,7 @@ class AgentSummarizerService:
                 except Exception as exc:
                     return (False, f"Redis check failed: {exc}")
             
-            self.health_checker.register_check("redis", redis_check)
+            self.health_checker.register_check("redis", TTLCachedCheck(redis_check))
         else:
             # Register a check that reports Redis as unavailable but not critical
             self.health_checker.register_check("redis", lambda: (False, "Event bus not initialized"))
@@ -119,7 +477,7 @@ class AgentSummarizerService:
             except Exception as exc:
                 return (False, f"OpenAI check failed: {exc}")
         
-        self.health_checker.register_check("openai_api", openai_check)
+        self.health_checker.register_check("openai_api", TTLCachedCheck(openai_check))
         
         # Agent check
         def agent_check() -> tuple[bool, str]:
@@ -132,10 +490,321 @@ class AgentSummarizerService:
     async def initialize(self) -> None:
         """Initialize async components."""
         logger.info("Initializing agent summarizer service")
+        self._metric_task = asyncio.create_task(self._metric_flusher())
+        self._health_task = asyncio.create_task(self._health_refresher())
+        self._batcher.start()
+        if self.event_bus is not None and self.agent is not None:
+            self._retry_task = asyncio.create_task(self._retry_worker())
 
     async def shutdown(self) -> None:
         """Cleanup on shutdown."""
         logger.info("Shutting down agent summarizer service")
+        await self._batcher.stop()
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+        if self._retry_task is not None:
+            self._retry_task.cancel()
+            try:
+                await self._retry_task
+            except asyncio.CancelledError:
+                pass
+        if self._metric_task is not None:
+            self._metric_task.cancel()
+            try:
+                await self._metric_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_metrics()
+        if self._pending_publishes:
+            await asyncio.gather(*self._pending_publishes, return_exceptions=True)
+        if self.agent is not None:
+            await self.agent.aclose()
+        await self._http.aclose()
+        _stop_logging()
+
+    def _emit(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
+        """Buffer a metric for batched emission off the request path.
+
+        Args:
+            name: Metric name
+            value: Metric value
+            tags: Optional metric tags
+        """
+        self._metric_queue.put_nowait((name, value, tags))
+
+    def _flush_metrics(self) -> None:
+        """Drain and emit everything currently buffered."""
+        batch = []
+        while not self._metric_queue.empty():
+            batch.append(self._metric_queue.get_nowait())
+        if batch:
+            self.observability.emit_metric_batch(batch)
+
+    async def _metric_flusher(self) -> None:
+        """Background task draining the metric buffer in batches.
+
+        Waits for the first event, then collects up to
+        METRIC_FLUSH_MAX_EVENTS more within METRIC_FLUSH_INTERVAL_SECONDS
+        before emitting one batch. asyncio.timeout (rather than wait_for
+        around each get) keeps external cancellation intact: wait_for can
+        swallow a cancel that lands in the same tick as an item, leaving
+        the task wedged in "cancelling" and hanging shutdown.
+        """
+        while True:
+            batch = [await self._metric_queue.get()]
+            try:
+                async with asyncio.timeout(METRIC_FLUSH_INTERVAL_SECONDS):
+                    while len(batch) < METRIC_FLUSH_MAX_EVENTS:
+                        batch.append(await self._metric_queue.get())
+            except TimeoutError:
+                pass
+            self.observability.emit_metric_batch(batch)
+
+    async def _enqueue_retry(self, request: SummarizeRequest, attempts: int = 1) -> None:
+        """Queue a failed summarization for background retry.
+
+        Transient failures (rate limits, upstream 5xx) already cost the
+        full prompt; queueing preserves that work instead of dropping it.
+
+        Args:
+            request: The request that failed
+            attempts: Retry attempt this entry represents
+        """
+        if self.event_bus is None:
+            return
+        payload = request.model_dump()
+        payload["attempts"] = attempts
+        try:
+            await self.event_bus.redis.rpush(RETRY_QUEUE_KEY, orjson.dumps(payload))
+            logger.info(
+                "Queued meeting %s for retry (attempt %d)", request.meeting_id, attempts
+            )
+        except Exception as exc:
+            logger.warning("Failed to enqueue retry for %s: %s", request.meeting_id, exc)
+
+    async def _retry_worker(self) -> None:
+        """Background task retrying summarizations from the Redis queue.
+
+        Pops one entry at a time so retries trickle out instead of
+        re-creating the burst that caused the original failures. Recovered
+        summaries are cached and their events published as if the original
+        request had succeeded; entries are dropped after RETRY_MAX_ATTEMPTS.
+        """
+        while True:
+            try:
+                raw = await self.event_bus.redis.lpop(RETRY_QUEUE_KEY)
+            except Exception as exc:
+                logger.debug("Retry queue read failed: %s", exc)
+                raw = None
+
+            if raw is None:
+                await asyncio.sleep(RETRY_POLL_INTERVAL_SECONDS)
+                continue
+
+            try:
+                payload = orjson.loads(raw)
+                attempts = payload.pop("attempts", 1)
+                request = SummarizeRequest.model_validate(payload)
+            except Exception as exc:
+                logger.warning("Dropping malformed retry queue entry: %s", exc)
+                continue
+
+            summary = await summarize_meeting(
+                agent=self.agent,
+                meeting_id=request.meeting_id,
+                title=request.title,
+                transcript=request.transcript,
+                additional_context=request.additional_context,
+            )
+
+            if "error" in summary.metadata:
+                if attempts < RETRY_MAX_ATTEMPTS:
+                    await self._enqueue_retry(request, attempts + 1)
+                else:
+                    logger.warning(
+                        "Giving up on meeting %s after %d retry attempts",
+                        request.meeting_id,
+                        attempts,
+                    )
+                continue
+
+            await self._store_cached_summary(self._summary_cache_key(request), summary)
+            await self._publish_summary_event(request, summary)
+            self._emit("agent.invocation.retry_recovered", 1.0, _SUMMARIZER_TAGS)
+            logger.info("Retry recovered summary for meeting %s", request.meeting_id)
+
+    async def _publish_summary_event(
+        self,
+        request: SummarizeRequest,
+        summary: MeetingSummary,
+        action_items_dump: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """Publish a SummaryGenerated event; publish failures are logged.
+
+        Args:
+            request: Originating summarization request
+            summary: The generated summary
+            action_items_dump: Pre-dumped action items, when the caller has
+                already materialized them for the response
+        """
+        if self.event_bus is None:
+            return
+        if action_items_dump is None:
+            action_items_dump = ACTION_ITEMS_ADAPTER.dump_python(summary.action_items)
+        try:
+            # Values come straight from our own validated models, so
+            # model_construct safely skips a second validation pass
+            event = SummaryGeneratedEvent.model_construct(
+                meeting_id=request.meeting_id,
+                summary=summary.summary,
+                action_items=action_items_dump,
+                risks=summary.risks,
+                summary_metadata=summary.metadata,
+            )
+            # Serialize once in pydantic-core and hand the bus the bytes;
+            # publish() would re-walk the model into a dict and back
+            await self.event_bus.publish_raw(
+                event.event_type, event.to_json(), event.correlation_id
+            )
+        except Exception as event_exc:
+            logger.warning("Failed to publish event: %s", event_exc)
+
+    async def _refresh_health(self) -> tuple[bytes, int]:
+        """Run the health checks and store a fresh serialized snapshot.
+
+        The lock single-flights concurrent cold-start callers against the
+        background refresher; a snapshot refreshed while waiting on the
+        lock is reused instead of probing again.
+
+        Returns:
+            (body_bytes, status_code) for the /health response
+        """
+        async with self._health_lock:
+            cached = self._health_cache
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < HEALTH_CACHE_TTL_SECONDS
+            ):
+                return cached[1], cached[2]
+
+            health_report = await self.health_checker.check_health()
+
+            # 200 as long as the liveness check passes; dependency failures
+            # are reported in the body without failing the probe
+            liveness_check = next(
+                (c for c in health_report.checks if c.name == "liveness"), None
+            )
+            is_alive = liveness_check is not None and liveness_check.status == "healthy"
+            status_code = 200 if is_alive else 503
+
+            body = orjson.dumps(health_report.model_dump())
+            self._health_cache = (time.monotonic(), body, status_code)
+            return body, status_code
+
+    async def _health_refresher(self) -> None:
+        """Background task keeping the health snapshot fresh.
+
+        Re-runs the probes on a fixed interval so /health never pays
+        probe latency, not even on the first request after expiry. A
+        refresh that hangs longer than the interval is abandoned.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._refresh_health(), timeout=HEALTH_REFRESH_INTERVAL_SECONDS
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Background health refresh failed: %s", exc)
+            await asyncio.sleep(HEALTH_REFRESH_INTERVAL_SECONDS)
+
+    async def health_response(self) -> tuple[bytes, int]:
+        """Return the latest health snapshot with zero probe I/O.
+
+        The background refresher keeps the snapshot current; only a
+        request racing the very first refresh ever runs the probes
+        inline.
+
+        Returns:
+            (body_bytes, status_code) for the /health response
+        """
+        cached = self._health_cache
+        if cached is not None and time.monotonic() - cached[0] < HEALTH_CACHE_TTL_SECONDS:
+            return cached[1], cached[2]
+        return await self._refresh_health()
+
+    def _summary_cache_key(self, request: SummarizeRequest) -> str:
+        """Build the cache key for a summarization request.
+
+        Keyed on everything that shapes the prompt — model, instructions,
+        title, transcript, and canonicalized additional context — so a
+        model upgrade, prompt change, or different context naturally
+        invalidates old entries.
+
+        Args:
+            request: Summarization request
+
+        Returns:
+            Redis key for the cached summary
+        """
+        context_blob = (
+            orjson.dumps(request.additional_context, option=orjson.OPT_SORT_KEYS)
+            if request.additional_context
+            else b""
+        )
+        material = (
+            f"{self.agent.model}|{self.agent.instructions}|{request.title}|{request.transcript}|".encode("utf-8")
+            + context_blob
+        )
+        return "sum:" + hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    async def _get_cached_summary(self, key: str) -> Optional[MeetingSummary]:
+        """Look up a cached summary; cache failures are treated as misses.
+
+        Args:
+            key: Cache key from _summary_cache_key
+
+        Returns:
+            Cached summary, or None on miss
+        """
+        if not self.settings.cache_enabled or self.event_bus is None:
+            return None
+        try:
+            cached = await self.event_bus.redis.get(key)
+        except Exception as exc:
+            logger.debug("Summary cache read failed: %s", exc)
+            return None
+        if cached is None:
+            return None
+        try:
+            return MeetingSummary.model_validate_json(cached)
+        except Exception:
+            return None
+
+    async def _store_cached_summary(self, key: str, summary: MeetingSummary) -> None:
+        """Store a freshly computed summary; error stubs are not cached.
+
+        Args:
+            key: Cache key from _summary_cache_key
+            summary: Summary to cache
+        """
+        if (
+            not self.settings.cache_enabled
+            or self.event_bus is None
+            or "error" in summary.metadata
+        ):
+            return
+        try:
+            await self.event_bus.redis.setex(
+                key, SUMMARY_CACHE_TTL_SECONDS, summary.model_dump_json()
+            )
+        except Exception as exc:
+            logger.debug("Summary cache write failed: %s", exc)
 
     async def summarize(self, request: SummarizeRequest) -> SummarizeResponse:
         """Summarize a meeting.
@@ -154,65 +823,87 @@ class AgentSummarizerService:
                 detail="Service unavailable: agent not initialized. Check environment variables.",
             )
         
+        await self._resolve_transcript(request)
+
+        transcript_len = len(request.transcript)
+
         with self.observability.trace_operation("agent.summarize") as span:
             span.set_tag("task_id", request.task_id)
             span.set_tag("meeting_id", request.meeting_id)
-            span.set_tag("transcript_length", len(request.transcript))
+            span.set_tag("transcript_length", transcript_len)
             
-            logger.info("Summarizing meeting: %s (%s)", request.meeting_id, request.title)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Summarizing meeting: %s (%s) len=%d",
+                    request.meeting_id,
+                    request.title,
+                    transcript_len,
+                )
             
             try:
-                # Invoke agent
-                summary = await summarize_meeting(
-                    agent=self.agent,
-                    meeting_id=request.meeting_id,
-                    title=request.title,
-                    transcript=request.transcript,
-                    additional_context=request.additional_context,
-                )
-                
-                # Emit metrics
-                self.observability.emit_metric(
-                    "agent.invocation.success",
-                    1.0,
-                    {"agent": "summarizer"},
-                )
-                
-                # Publish event if event bus is available
-                if self.event_bus is not None:
-                    try:
-                        from shared import SummaryGeneratedEvent
-                        event = SummaryGeneratedEvent(
-                            meeting_id=request.meeting_id,
-                            summary=summary.summary,
-                            action_items=[item.model_dump() for item in summary.action_items],
-                            risks=summary.risks,
-                            summary_metadata=summary.metadata,
-                        )
-                        await self.event_bus.publish(event)
-                    except Exception as event_exc:
-                        logger.warning("Failed to publish event: %s", event_exc)
+                # Duplicate requests (retries, re-submissions) are served
+                # from cache without another model call
+                cache_key = self._summary_cache_key(request)
+                summary = await self._get_cached_summary(cache_key)
+                cache_hit = summary is not None
+                span.set_tag("cache_hit", cache_hit)
+
+                if summary is None:
+                    # Invoke agent
+                    summary = await summarize_meeting(
+                        agent=self.agent,
+                        meeting_id=request.meeting_id,
+                        title=request.title,
+                        transcript=request.transcript,
+                        additional_context=request.additional_context,
+                    )
+                    await self._store_cached_summary(cache_key, summary)
+                    # The agent returns an error stub when retries are
+                    # exhausted; queue it so the work isn't lost
+                    if "error" in summary.metadata:
+                        await self._enqueue_retry(request)
+                else:
+                    logger.info("Summary cache hit for meeting %s", request.meeting_id)
+
+                # Emit metrics (buffered, flushed in batches)
+                self._emit("agent.invocation.success", 1.0, _SUMMARIZER_TAGS)
+
+                # Materialize list dumps once; the event and the response
+                # share the same objects
+                action_items_dump = ACTION_ITEMS_ADAPTER.dump_python(summary.action_items)
+
+                # Publish event only for fresh summaries, not cached
+                # repeats; fire-and-forget so the caller doesn't wait for
+                # the Redis round-trip
+                if not cache_hit:
+                    publish_task = asyncio.create_task(
+                        self._publish_summary_event(request, summary, action_items_dump)
+                    )
+                    self._pending_publishes.add(publish_task)
+                    publish_task.add_done_callback(self._pending_publishes.discard)
                 
-                # Convert to response
-                response = SummarizeResponse(
+                # Convert to response; the fields were already validated
+                # as part of MeetingSummary, so skip re-validation
+                response = SummarizeResponse.model_construct(
                     task_id=request.task_id,
                     meeting_id=request.meeting_id,
                     summary=summary.summary,
                     key_points=summary.key_points,
-                    action_items=[item.model_dump() for item in summary.action_items],
-                    decisions=[dec.model_dump() for dec in summary.decisions],
+                    action_items=action_items_dump,
+                    decisions=DECISIONS_ADAPTER.dump_python(summary.decisions),
                     risks=summary.risks,
                     next_steps=summary.next_steps,
                     attendees_mentioned=summary.attendees_mentioned,
                     metadata=summary.metadata,
                 )
                 
-                logger.info(
-                    "Meeting summarized: %s - %d action items, %d risks",
-                    request.meeting_id,
-                    len(summary.action_items),
-                    len(summary.risks),
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Meeting summarized: %s - %d action items, %d risks",
+                        request.meeting_id,
+                        len(summary.action_items),
+                        len(summary.risks),
+                    )
                 
                 return response
             
@@ -221,26 +912,166 @@ class AgentSummarizerService:
             except Exception as exc:
                 logger.exception("Failed to summarize meeting: %s", exc)
                 
-                self.observability.emit_metric(
-                    "agent.invocation.failure",
-                    1.0,
-                    {"agent": "summarizer"},
-                )
+                self._emit("agent.invocation.failure", 1.0, _SUMMARIZER_TAGS)
                 
                 raise HTTPException(
                     status_code=500,
                     detail=f"Summarization failed: {str(exc)}",
                 )
 
+    async def _resolve_transcript(self, request: SummarizeRequest) -> None:
+        """Fetch a URL-referenced transcript onto the request in place.
+
+        Large transcripts referenced by URL skip JSON body buffering and
+        validation; the fetch reuses the service's pooled HTTP client.
+
+        Args:
+            request: Request whose transcript may be URL-referenced
+
+        Raises:
+            HTTPException: If no transcript is available or the fetch fails
+        """
+        if not request.transcript and request.transcript_url:
+            try:
+                fetched = await self._http.get(request.transcript_url)
+                fetched.raise_for_status()
+            except Exception as exc:
+                logger.warning(
+                    "Failed to fetch transcript for meeting %s: %s",
+                    request.meeting_id,
+                    exc,
+                )
+                raise HTTPException(
+                    status_code=502,
+                    detail=f"Failed to fetch transcript: {exc}",
+                )
+            request.transcript = fetched.text
+        if not request.transcript:
+            raise HTTPException(
+                status_code=400,
+                detail="Either transcript or transcript_url is required",
+            )
+
+    async def summarize_coalesced(self, request: SummarizeRequest) -> SummarizeResponse:
+        """Summarize via the micro-batcher, falling back when it isn't running.
+
+        Args:
+            request: Summarization request
+
+        Returns:
+            Summarization response
+        """
+        if not self._batcher.is_running:
+            return await self.summarize(request)
+        return await self._batcher.submit(request)
+
+    async def summarize_batch(self, batch: BatchSummarizeRequest) -> BatchSummarizeResponse:
+        """Summarize multiple meetings concurrently.
+
+        Requests are fanned out with bounded concurrency so that one large
+        batch cannot exhaust OpenAI rate limits. Per-item failures are
+        captured without failing the whole batch.
+
+        Args:
+            batch: Batch of summarization requests
+
+        Returns:
+            Per-item results in the same order as the input
+        """
+        async def _one(request: SummarizeRequest) -> SummarizeResponse:
+            async with self._summarize_semaphore:
+                return await self.summarize(request)
+
+        outcomes = await asyncio.gather(
+            *(_one(request) for request in batch.items),
+            return_exceptions=True,
+        )
+
+        results: List[BatchItemResult] = []
+        for request, outcome in zip(batch.items, outcomes):
+            if isinstance(outcome, BaseException):
+                detail = outcome.detail if isinstance(outcome, HTTPException) else str(outcome)
+                results.append(
+                    BatchItemResult(
+                        task_id=request.task_id,
+                        meeting_id=request.meeting_id,
+                        success=False,
+                        error=str(detail),
+                    )
+                )
+            else:
+                results.append(
+                    BatchItemResult(
+                        task_id=request.task_id,
+                        meeting_id=request.meeting_id,
+                        success=True,
+                        response=outcome,
+                    )
+                )
+
+        return BatchSummarizeResponse(results=results)
+
+    async def submit_batch_async(self, batch: BatchAsyncSummarizeRequest) -> BatchAsyncSummarizeResponse:
+        """Submit meetings for non-interactive summarization via the Batch API.
+
+        Args:
+            batch: Meetings to summarize
+
+        Returns:
+            Batch job ID for later polling
+        """
+        if self.agent is None:
+            raise HTTPException(
+                status_code=503,
+                detail="Service unavailable: agent not initialized. Check environment variables.",
+            )
+
+        meetings = [(item.meeting_id, item.title, item.transcript) for item in batch.items]
+        try:
+            batch_id = await submit_batch_summaries(self.agent, meetings)
+        except Exception as exc:
+            logger.exception("Failed to submit batch: %s", exc)
+            raise HTTPException(status_code=500, detail=f"Batch submission failed: {str(exc)}")
+
+        logger.info("Submitted batch %s with %d meetings", batch_id, len(meetings))
+        return BatchAsyncSummarizeResponse(batch_id=batch_id, item_count=len(meetings))
+
+    async def batch_async_status(self, batch_id: str) -> Dict[str, Any]:
+        """Poll a batch job and return results when completed.
+
+        Args:
+            batch_id: OpenAI batch job ID
+
+        Returns:
+            Batch status, plus per-meeting summaries once completed
+        """
+        if self.agent is None:
+            raise HTTPException(
+                status_code=503,
+                detail="Service unavailable: agent not initialized. Check environment variables.",
+            )
+
+        try:
+            batch = await poll_batch(self.agent, batch_id)
+        except Exception as exc:
+            logger.exception("Failed to poll batch %s: %s", batch_id, exc)
+            raise HTTPException(status_code=500, detail=f"Batch poll failed: {str(exc)}")
+
+        result: Dict[str, Any] = {"batch_id": batch_id, "status": batch.status}
+        if batch.status == "completed":
+            summaries = await collect_batch_summaries(self.agent, batch_id)
+            result["summaries"] = {
+                meeting_id: summary.model_dump() for meeting_id, summary in summaries.items()
+            }
+        return result
+
 
-# Create FastAPI app
-app = FastAPI(title="BudAI Agent Summarizer", version="1.0.0")
 service = AgentSummarizerService()
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Initialize on startup."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background tasks on startup and drain them on shutdown."""
     await service.initialize()
     logger.info("=" * 60)
     logger.info("Agent summarizer service started")
@@ -250,62 +1081,174 @@ async def startup_event() -> None:
     logger.info("Agent initialized: %s", service.agent is not None)
     logger.info("Event bus initialized: %s", service.event_bus is not None)
     logger.info("=" * 60)
+    yield
+    await service.shutdown()
 
 
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Cleanup on shutdown."""
-    await service.shutdown()
+# Create FastAPI app
+app = FastAPI(
+    title="BudAI Agent Summarizer",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+# Summaries compress ~5-10x as English JSON; minimum_size leaves small
+# bodies like /health and / uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 @app.get("/")
-async def root() -> JSONResponse:
+async def root() -> Response:
     """Root endpoint."""
-    return JSONResponse(
-        content={
-            "service": "BudAI Agent Summarizer",
-            "version": "1.0.0",
-            "agent": "Meeting Summarizer",
-            "status": "running",
-        }
-    )
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
-async def health() -> JSONResponse:
+async def health() -> Response:
     """Health check endpoint per PRIME_DIRECTIVE requirements.
-    
+
     Returns 200 if the liveness check passes (service is running).
     Dependency failures (Redis, OpenAI) are reported but don't fail the health check.
+    The serialized report is cached for HEALTH_CACHE_TTL_SECONDS.
     """
-    health_report = await service.health_checker.check_health()
-    
-    # Check if liveness check passed - that's all we need for Railway health check
-    liveness_check = next((c for c in health_report.checks if c.name == "liveness"), None)
-    is_alive = liveness_check and liveness_check.status == "healthy"
-    
-    # Return 200 if service is alive, even if some dependencies are unhealthy
-    # This allows the service to start and be marked as healthy by Railway
-    status_code = 200 if is_alive else 503
-    
-    return JSONResponse(
-        content=health_report.model_dump(),
+    body, status_code = await service.health_response()
+    return Response(
+        content=body,
         status_code=status_code,
+        media_type="application/json",
+        headers={"Cache-Control": f"max-age={int(HEALTH_CACHE_TTL_SECONDS)}"},
     )
 
 
 @app.post("/summarize")
-async def summarize(request: SummarizeRequest) -> JSONResponse:
+async def summarize(http_request: Request) -> Response:
     """Summarize a meeting.
 
+    The body is validated bytes-to-model in one pydantic-core pass;
+    multi-megabyte transcripts skip FastAPI's dict-tree parse.
+
     Args:
-        request: Summarization request with meeting details
+        http_request: Incoming request carrying the JSON body
 
     Returns:
         Structured meeting summary
     """
-    response = await service.summarize(request)
-    return JSONResponse(content=response.model_dump())
+    request = _parse_summarize_request(await http_request.body())
+    response = await service.summarize_coalesced(request)
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@app.post("/summarize/stream")
+async def summarize_stream(http_request: Request) -> StreamingResponse:
+    """Summarize a meeting, streaming the summary JSON as it is generated.
+
+    Emits server-sent events with content deltas so callers can start
+    consuming partial output before the model finishes, followed by a
+    terminal [DONE] event.
+
+    Args:
+        http_request: Incoming request carrying the JSON body
+
+    Returns:
+        SSE stream of JSON content fragments
+    """
+    request = _parse_summarize_request(await http_request.body())
+    if service.agent is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Service unavailable: agent not initialized. Check environment variables.",
+        )
+    await service._resolve_transcript(request)
+
+    async def event_stream():
+        try:
+            async for delta in summarize_meeting_stream(
+                agent=service.agent,
+                meeting_id=request.meeting_id,
+                title=request.title,
+                transcript=request.transcript,
+                additional_context=request.additional_context,
+            ):
+                yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+        except Exception as exc:
+            logger.exception("Streaming summarization failed: %s", exc)
+            yield b"data: " + orjson.dumps({"error": str(exc)}) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+
+    # Content-Encoding: identity makes GZipMiddleware pass the stream
+    # through untouched; gzip would buffer the small SSE deltas in the
+    # compressor and defeat time-to-first-byte
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Content-Encoding": "identity"},
+    )
+
+
+@app.post("/summarize/batch")
+async def summarize_batch(batch: BatchSummarizeRequest) -> Response:
+    """Summarize multiple meetings in one call.
+
+    Args:
+        batch: List of summarization requests
+
+    Returns:
+        Per-item results in input order
+    """
+    response = await service.summarize_batch(batch)
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@app.post("/summarize/packed")
+async def summarize_packed(batch: BatchAsyncSummarizeRequest) -> ORJSONResponse:
+    """Summarize several short meetings with packed completion calls.
+
+    Packs multiple meetings into each model request; useful when request
+    rate, not token volume, is the binding limit.
+
+    Args:
+        batch: Meetings to summarize
+
+    Returns:
+        One summary per meeting, in input order
+    """
+    if service.agent is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Service unavailable: agent not initialized. Check environment variables.",
+        )
+
+    items = [(item.meeting_id, item.title, item.transcript) for item in batch.items]
+    summaries = await summarize_meetings_packed(service.agent, items)
+    return ORJSONResponse(content={"summaries": [summary.model_dump() for summary in summaries]})
+
+
+@app.post("/summarize/batch_async")
+async def summarize_batch_async(batch: BatchAsyncSummarizeRequest) -> Response:
+    """Submit meetings for asynchronous summarization via the OpenAI Batch API.
+
+    Args:
+        batch: Meetings to summarize
+
+    Returns:
+        Batch job ID for polling via GET /summarize/batch_async/{batch_id}
+    """
+    response = await service.submit_batch_async(batch)
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@app.get("/summarize/batch_async/{batch_id}")
+async def summarize_batch_async_status(batch_id: str) -> ORJSONResponse:
+    """Poll an asynchronous summarization batch.
+
+    Args:
+        batch_id: Batch job ID returned by POST /summarize/batch_async
+
+    Returns:
+        Batch status, plus summaries once the batch has completed
+    """
+    result = await service.batch_async_status(batch_id)
+    return ORJSONResponse(content=result)
 
 
 def main() -> None:
@@ -313,7 +1256,28 @@ def main() -> None:
     import uvicorn
 
     port = int(os.getenv("PORT", "8002"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Workers default to 1: os.cpu_count() reports host cores inside
+    # containers, and every extra worker also needs its slice of the
+    # OpenAI rate budget (the agent divides its limiter by this value),
+    # so scaling out is an explicit operator decision
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    # uvloop and httptools replace the pure-Python event loop and HTTP
+    # parser; both ship with uvicorn[standard]. The access log is off:
+    # it allocates and formats a line per request, and the span/metric
+    # pipeline already records request activity. Multi-worker mode needs
+    # the import-string form so each forked worker re-imports the module
+    # and builds its own service instance (agent, event bus, HTTP pool)
+    uvicorn.run(
+        "service.service:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+        access_log=False,
+        workers=workers,
+    )
 
 
 if __name__ == "__main__":
@@ -42,6 +42,7 @@ from .health import (
     HealthChecker,
     HealthStatus,
     ServiceHealth,
+    TTLCachedCheck,
     check_http_endpoint,
     check_openai_api,
     check_redis_connection,
@@ -91,6 +92,7 @@ __all__ = [
     "HealthChecker",
     "HealthStatus",
     "ServiceHealth",
+    "TTLCachedCheck",
     "check_http_endpoint",
     "check_openai_api",
     "check_redis_connection",
@@ -187,6 +187,9 @@ class AgentServiceSettings(BaseServiceSettings):
     max_retries: int = Field(3, description="Max retries for agent invocation")
     timeout_seconds: int = Field(300, description="Agent execution timeout")
     reasoning_effort: str = Field("medium", description="Reasoning effort: low, medium, high")
+    max_concurrent_requests: int = Field(16, description="Max concurrent agent invocations in batch requests")
+    transcript_max_tokens: int = Field(48000, description="Token budget for transcripts after compaction")
+    cache_enabled: bool = Field(True, description="Serve repeated requests from the response cache")
 
 
 def load_deployment_spec(environment: str, specs_dir: Path | str = "specs") -> DeploymentSpec:
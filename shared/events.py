@@ -240,6 +240,42 @@ class EventBus:
         )
         return str(message_id)
 
+    async def publish_raw(
+        self,
+        event_type: str,
+        payload: bytes | str,
+        correlation_id: Optional[str] = None,
+    ) -> str:
+        """Publish a pre-serialized event payload to the bus.
+
+        Skips the model_dump + json.dumps walk for callers that already
+        hold the event as JSON bytes (e.g. serialized once and shared
+        with another consumer).
+
+        Args:
+            event_type: Event type identifier
+            payload: Event payload already serialized as JSON
+            correlation_id: Optional correlation ID for related events
+
+        Returns:
+            Event ID (Redis stream message ID)
+        """
+        message_id = await self.redis.xadd(
+            self.stream_name,
+            {
+                "event_type": event_type,
+                "data": payload,
+                "correlation_id": correlation_id or "",
+            },
+        )
+
+        logger.debug(
+            "Published raw event (type=%s, correlation_id=%s)",
+            event_type,
+            correlation_id,
+        )
+        return str(message_id)
+
     def subscribe(self, event_type: str, handler: Callable[[BaseEvent], None]) -> None:
         """Subscribe to an event type.
 
@@ -17,6 +17,10 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single health check's execution; a hung dependency
+# (network partition, DNS stall) must not tie up the /health path
+CHECK_TIMEOUT_SECONDS = 2.0
+
 
 class HealthStatus(str, Enum):
     """Health check status values."""
@@ -98,11 +102,12 @@ class HealthChecker:
         start_time = time.time()
         
         try:
-            # Execute check (handle both async and sync functions)
-            if asyncio.iscoroutinefunction(check_fn):
-                result = await check_fn()
-            else:
-                result = check_fn()
+            # Execute check (handles sync functions, async functions, and
+            # async callables such as TTLCachedCheck); async checks are
+            # bounded so a hung dependency can't stall the report
+            result = check_fn()
+            if asyncio.iscoroutine(result):
+                result = await asyncio.wait_for(result, timeout=CHECK_TIMEOUT_SECONDS)
 
             latency_ms = (time.time() - start_time) * 1000
 
@@ -125,6 +130,19 @@ class HealthChecker:
                 latency_ms=latency_ms,
             )
 
+        except asyncio.TimeoutError:
+            latency_ms = (time.time() - start_time) * 1000
+            logger.warning(
+                "Health check '%s' timed out after %.1fs", name, CHECK_TIMEOUT_SECONDS
+            )
+
+            return HealthCheck(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                message="timeout",
+                latency_ms=latency_ms,
+            )
+
         except Exception as exc:
             latency_ms = (time.time() - start_time) * 1000
             logger.exception("Health check '%s' failed: %s", name, exc)
@@ -172,6 +190,53 @@ class HealthChecker:
         )
 
 
+class TTLCachedCheck:
+    """Wrap a health check with a short-lived result cache.
+
+    Load balancers probe /health far more often than dependency state
+    actually changes; caching keeps most probes O(µs) and stops upstream
+    checks (e.g. a real OpenAI API call) from consuming rate-limit
+    headroom. Concurrent callers share a single in-flight refresh.
+    """
+
+    def __init__(self, check_fn: Callable[[], Any], ttl_seconds: float = 5.0) -> None:
+        """Initialize the cached check.
+
+        Args:
+            check_fn: Async or sync check function to wrap
+            ttl_seconds: How long a result stays fresh
+        """
+        self.check_fn = check_fn
+        self.ttl_seconds = ttl_seconds
+        self._value: Any = None
+        self._checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def __call__(self) -> Any:
+        """Return the cached result, refreshing it when stale."""
+        if (
+            self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.ttl_seconds
+        ):
+            return self._value
+
+        async with self._lock:
+            # Re-check under the lock: another caller may have refreshed
+            if (
+                self._checked_at is not None
+                and time.monotonic() - self._checked_at < self.ttl_seconds
+            ):
+                return self._value
+
+            result = self.check_fn()
+            if asyncio.iscoroutine(result):
+                result = await result
+
+            self._value = result
+            self._checked_at = time.monotonic()
+            return result
+
+
 # Common health check implementations
 
 
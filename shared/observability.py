@@ -227,6 +227,33 @@ class ServiceObservability:
             extra={"metric_name": name, "metric_value": value, "metric_tags": tags},
         )
 
+    def emit_metric_batch(
+        self, events: list[tuple[str, float, Optional[Dict[str, str]]]]
+    ) -> None:
+        """Emit several metric values in one call.
+
+        Amortizes the per-metric bookkeeping and logging cost over a batch;
+        intended for callers that buffer metrics off the request path.
+
+        Args:
+            events: List of (name, value, tags) tuples
+
+        Example:
+            observability.emit_metric_batch([
+                ("agent.invocation.success", 1.0, {"agent": "summarizer"}),
+                ("agent.invocation.duration_ms", 1234.5, None),
+            ])
+        """
+        for name, value, _tags in events:
+            metric_key = f"{self.service_name}.{name}"
+
+            if metric_key not in self._metrics:
+                self._metrics[metric_key] = []
+
+            self._metrics[metric_key].append(value)
+
+        self.logger.debug("Metric batch: %d events", len(events))
+
     def log_event(
         self,
         level: str,
@@ -0,0 +1,53 @@
+"""
+Request-level smoke tests for the summarizer HTTP service.
+
+Exercises the /summarize validation layer end to end through the ASGI
+stack. Only fastapi is required; no Redis or OpenAI connectivity is
+needed because requests never reach the agent.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+# The service settings require an API key at import time
+os.environ.setdefault("BUDAI_OPENAI_API_KEY", "test-key")
+
+from service.service import app  # noqa: E402
+
+client = TestClient(app)
+
+
+def test_malformed_json_returns_422() -> None:
+    """Invalid JSON must produce a clean 422, not a serialization 500."""
+    response = client.post(
+        "/summarize",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"]
+
+
+def test_missing_fields_return_422() -> None:
+    """Schema violations report the offending fields."""
+    response = client.post("/summarize", json={"task_id": "t1"})
+    assert response.status_code == 422
+    locations = [tuple(err["loc"]) for err in response.json()["detail"]]
+    assert ("meeting_id",) in locations
+
+
+def test_valid_body_passes_validation() -> None:
+    """A well-formed body must get past request parsing.
+
+    Without a transcript the handler rejects it with a 400, or a 503
+    when no agent is configured — never a validation 422.
+    """
+    response = client.post(
+        "/summarize",
+        json={"task_id": "t1", "meeting_id": "m1", "title": "Standup"},
+    )
+    assert response.status_code in (400, 503)